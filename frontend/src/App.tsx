@@ -1,5 +1,6 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import {
+  Alert,
   Container,
   Typography,
   CssBaseline,
@@ -35,32 +36,95 @@ interface Log {
   target_entities: TargetEntity[];
 }
 
+interface SearchTimings {
+  time_to_first_result_ms: number;
+  total_ms: number;
+  degraded: boolean;
+}
+
+interface RankDelta {
+  order: string[];
+  added: Record<string, Log>;
+  removed: string[];
+}
+
 function App() {
   const [logs, setLogs] = useState<Log[]>([]);
   const [searchQuery, setSearchQuery] = useState('');
   const [searchType, setSearchType] = useState('keyword');
+  const [timings, setTimings] = useState<SearchTimings | null>(null);
+  const [notice, setNotice] = useState<string | null>(null);
+  const eventSourceRef = useRef<EventSource | null>(null);
 
-  const fetchLogs = async () => {
-    const url = new URL('http://localhost:8000/search');
+  const fetchLogs = () => {
+    const url = new URL('http://localhost:8000/search/stream');
     url.searchParams.append('query', searchQuery);
     url.searchParams.append('search_type', searchType);
 
-    try {
-      const response = await fetch(url.toString());
-      if (!response.ok) {
-        throw new Error(`HTTP error! status: ${response.status}`);
+    // Only the latest search may update the list
+    eventSourceRef.current?.close();
+    const source = new EventSource(url.toString());
+    eventSourceRef.current = source;
+    const docs: Record<string, Log> = {};
+    let hasResults = false;
+    setTimings(null);
+    setNotice(null);
+
+    // Keep results already on screen; only clear the list if nothing arrived
+    const handleFailure = (message: string) => {
+      if (hasResults) {
+        setNotice(`Ranking unavailable (${message}), showing keyword results`);
+      } else {
+        setLogs([]); // Clear logs on error
       }
-      const data = await response.json();
-      setLogs(data);
-    } catch (error) {
-      console.error('Error fetching logs:', error);
-      setLogs([]); // Clear logs on error
-    }
+      source.close();
+    };
+
+    // First ranked list, sent as soon as the fastest leg returns
+    source.addEventListener('results', (event) => {
+      const data = JSON.parse((event as MessageEvent).data);
+      data.ids.forEach((id: string, i: number) => {
+        docs[id] = data.results[i];
+      });
+      setLogs(data.ids.map((id: string) => docs[id]));
+      hasResults = true;
+    });
+
+    // Fused hybrid ranking, sent as a delta against the first list
+    source.addEventListener('rerank', (event) => {
+      const delta: RankDelta = JSON.parse((event as MessageEvent).data).delta;
+      Object.assign(docs, delta.added);
+      setLogs(delta.order.map((id) => docs[id]));
+    });
+
+    source.addEventListener('done', (event) => {
+      const data: SearchTimings = JSON.parse((event as MessageEvent).data);
+      console.info('Search timings:', data);
+      setTimings(data);
+      if (data.degraded) {
+        setNotice('Server is busy, showing keyword results');
+      }
+      source.close();
+    });
+
+    // Failures after the stream started, e.g. a shed hybrid vector leg
+    source.addEventListener('search_error', (event) => {
+      const data = JSON.parse((event as MessageEvent).data);
+      console.error('Error fetching logs:', data);
+      handleFailure(data.detail);
+    });
+
+    // Connection errors, including 4xx/503 responses before the stream starts
+    source.onerror = () => {
+      console.error('Error fetching logs: stream connection failed');
+      handleFailure('connection failed');
+    };
   };
 
   // Initial fetch for all logs
   useEffect(() => {
     fetchLogs();
+    return () => eventSourceRef.current?.close();
   }, []);
 
   const handleSearch = () => {
@@ -82,6 +146,17 @@ function App() {
             setSearchType={setSearchType}
             handleSearch={handleSearch}
           />
+          {notice && (
+            <Alert severity="warning" sx={{ mb: 2 }}>
+              {notice}
+            </Alert>
+          )}
+          {timings && (
+            <Typography variant="caption" color="text.secondary">
+              First results in {timings.time_to_first_result_ms.toFixed(0)} ms
+              {' · '}total {timings.total_ms.toFixed(0)} ms
+            </Typography>
+          )}
           <LogList logs={logs} />
         </Box>
       </Container>
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Load test showing keyword latency under an embedding storm.
+
+Runs keyword searches alone, then again while semantic/hybrid searches flood
+the embedding model, and prints latency percentiles for both phases together
+with the storm's status codes and the server's admission statistics.
+
+    uv run python load_test.py --duration 20 --storm-concurrency 64
+    uv run python load_test.py --storm-type hybrid --storm-path /search/stream
+"""
+
+import argparse
+import json
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+
+def request(base_url, path, params, timeout):
+    """Send a GET request and return (status, latency in ms).
+
+    Streams that report a ``search_error`` event get that event name as status.
+    """
+    url = f"{base_url}{path}?{urllib.parse.urlencode(params)}"
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            body = response.read()
+            status = response.status
+        if b"event: search_error" in body:
+            status = "search_error"
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except OSError:
+        status = 0
+    return status, (time.perf_counter() - start) * 1000
+
+
+def run_clients(concurrency, duration, send):
+    """Call ``send`` from ``concurrency`` threads until ``duration`` elapses."""
+    results = []
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def client():
+        while time.monotonic() < deadline:
+            result = send()
+            with lock:
+                results.append(result)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(concurrency):
+            executor.submit(client)
+    return results
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def report(label, results):
+    """Print request count, status codes and latency percentiles."""
+    latencies = [latency for status, latency in results if status == 200]
+    statuses = dict(Counter(status for status, _ in results))
+    print(
+        f"{label:<32} n={len(results):<6} status={statuses} "
+        f"p50={percentile(latencies, 50):.1f}ms "
+        f"p95={percentile(latencies, 95):.1f}ms "
+        f"p99={percentile(latencies, 99):.1f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--query", default="user uploaded a file")
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--keyword-concurrency", type=int, default=4)
+    parser.add_argument("--storm-concurrency", type=int, default=32)
+    parser.add_argument(
+        "--storm-type", choices=["semantic", "hybrid"], default="semantic"
+    )
+    # /search/stream runs hybrid searches as two concurrent legs, so each
+    # request holds two worker threads
+    parser.add_argument(
+        "--storm-path", choices=["/search", "/search/stream"], default="/search"
+    )
+    parser.add_argument("--timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    def keyword():
+        params = {"query": args.query, "search_type": "keyword"}
+        return request(args.base_url, "/search", params, args.timeout)
+
+    def storm():
+        # Vary the text so no layer can serve the embedding from a cache
+        params = {
+            "query": f"{args.query} {time.perf_counter_ns()}",
+            "search_type": args.storm_type,
+        }
+        return request(args.base_url, args.storm_path, params, args.timeout)
+
+    print(f"Baseline: {args.keyword_concurrency} keyword clients")
+    baseline = run_clients(args.keyword_concurrency, args.duration, keyword)
+
+    print(
+        f"Storm: {args.keyword_concurrency} keyword clients + "
+        f"{args.storm_concurrency} {args.storm_type} clients on {args.storm_path}"
+    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        storm_future = executor.submit(
+            run_clients, args.storm_concurrency, args.duration, storm
+        )
+        under_storm = run_clients(args.keyword_concurrency, args.duration, keyword)
+        storm_results = storm_future.result()
+
+    print()
+    report("keyword (baseline)", baseline)
+    report("keyword (during storm)", under_storm)
+    report(f"{args.storm_type} {args.storm_path} (storm)", storm_results)
+
+    with urllib.request.urlopen(f"{args.base_url}/health/admission") as response:
+        print("\nAdmission stats:")
+        print(json.dumps(json.load(response), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""Command line tools for operating P-Engine.
+
+Run from the repository root, e.g. ``uv run python -m p-engine.cli.index build``.
+"""
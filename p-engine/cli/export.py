@@ -0,0 +1,64 @@
+"""Bulk export CLI.
+
+Streams every audit log matching a keyword search to a file or stdout::
+
+    uv run python -m p-engine.cli.export --query "login" --format parquet -o out.parquet
+"""
+
+import argparse
+import sys
+from contextlib import closing
+from typing import List, Optional
+
+from ..dependencies import DependencyContainer
+from ..services import EXPORT_FORMATS, ExportService
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the export CLI."""
+    parser = argparse.ArgumentParser(
+        prog="p-engine.cli.export", description="Export matching audit logs"
+    )
+    parser.add_argument("--query", default="", help="Search query text")
+    parser.add_argument(
+        "--search-type", default="keyword", help="Type of search to perform"
+    )
+    parser.add_argument(
+        "--format",
+        dest="export_format",
+        choices=list(EXPORT_FORMATS),
+        default="ndjson",
+        help="Output format",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="Output file, '-' for stdout"
+    )
+    args = parser.parse_args(argv)
+
+    export_service = ExportService(DependencyContainer.get_elasticsearch())
+
+    try:
+        chunks = export_service.export(
+            query=args.query,
+            search_type=args.search_type,
+            export_format=args.export_format,
+        )
+        with closing(chunks):
+            if args.output == "-":
+                for chunk in chunks:
+                    sys.stdout.buffer.write(chunk)
+                sys.stdout.buffer.flush()
+            else:
+                with open(args.output, "wb") as f:
+                    for chunk in chunks:
+                        f.write(chunk)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        DependencyContainer.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""Index management CLI.
+
+Builds versioned physical indices behind the search alias without downtime::
+
+    uv run python -m p-engine.cli.index build --source bulk_data.json
+    uv run python -m p-engine.cli.index status
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from ..config import INDEX_DEFINITIONS, LATEST_INDEX_VERSION, settings
+from ..dependencies import DependencyContainer
+from ..services import IndexService
+
+
+def build(args: argparse.Namespace) -> int:
+    """Build a new index from a bulk file and swap the alias onto it."""
+    service = IndexService(DependencyContainer.get_elasticsearch())
+    report = service.build(
+        source_path=args.source,
+        version=args.version,
+        chunk_size=args.chunk_size,
+        delete_old=args.delete_old,
+        max_failures=args.max_failures,
+    )
+    print(json.dumps(report.model_dump(), indent=2))
+    return 1 if report.documents_failed else 0
+
+
+def status(args: argparse.Namespace) -> int:
+    """Print the indices behind the alias with their document and segment counts."""
+    service = IndexService(DependencyContainer.get_elasticsearch())
+    indices = service.get_alias_indices()
+    if not indices:
+        print(f"Alias '{settings.elasticsearch_index}' does not exist")
+        return 1
+
+    for index in indices:
+        count = service.es.count(index=index)["count"]
+        segments = service.count_segments(index)
+        print(
+            f"{settings.elasticsearch_index} -> {index}: "
+            f"{count} docs, {segments} segments"
+        )
+    return 0
+
+
+def versions(args: argparse.Namespace) -> int:
+    """Print the available index definition versions."""
+    for version in sorted(INDEX_DEFINITIONS):
+        marker = " (latest)" if version == LATEST_INDEX_VERSION else ""
+        print(f"v{version}{marker}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point for the index management CLI."""
+    parser = argparse.ArgumentParser(
+        prog="p-engine.cli.index", description="Manage the audit log index"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser(
+        "build", help="Build a new index and swap the alias onto it"
+    )
+    build_parser.add_argument(
+        "--source", default="bulk_data.json", help="Bulk NDJSON file to load"
+    )
+    build_parser.add_argument(
+        "--version", type=int, default=None, help="Index definition version"
+    )
+    build_parser.add_argument(
+        "--chunk-size", type=int, default=None, help="Documents per bulk request"
+    )
+    build_parser.add_argument(
+        "--delete-old",
+        action="store_true",
+        help="Delete the indices previously behind the alias",
+    )
+    build_parser.add_argument(
+        "--max-failures",
+        type=int,
+        default=0,
+        help="Rejected documents tolerated before the build is aborted",
+    )
+    build_parser.set_defaults(func=build)
+
+    status_parser = subparsers.add_parser("status", help="Show the alias state")
+    status_parser.set_defaults(func=status)
+
+    versions_parser = subparsers.add_parser(
+        "versions", help="List index definition versions"
+    )
+    versions_parser.set_defaults(func=versions)
+
+    args = parser.parse_args(argv)
+    try:
+        return args.func(args)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        DependencyContainer.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 """Configuration module for the P-Engine application."""
 
+from .index_mappings import INDEX_DEFINITIONS, LATEST_INDEX_VERSION
 from .settings import settings
 
-__all__ = ["settings"]
+__all__ = ["settings", "INDEX_DEFINITIONS", "LATEST_INDEX_VERSION"]
@@ -0,0 +1,44 @@
+"""Versioned index definitions for the audit log index.
+
+Each version describes the mappings and static settings of a physical index.
+Physical indices are named after the version and built behind the
+``settings.elasticsearch_index`` alias, so adding a new version here never
+requires deleting the index that is currently serving searches.
+"""
+
+from typing import Any, Dict
+
+from .settings import settings
+
+INDEX_DEFINITIONS: Dict[int, Dict[str, Any]] = {
+    1: {
+        "settings": {"number_of_shards": 1},
+        "mappings": {
+            "properties": {
+                "id": {"type": "keyword"},
+                "action": {"type": "keyword"},
+                "summary": {"type": "text"},
+                "description": {"type": "text"},
+                "embedding_text": {"type": "text"},
+                "ip_address": {"type": "ip"},
+                "occured_at": {"type": "date"},
+                "created_at": {"type": "date"},
+                "actor_id": {"type": "keyword"},
+                "organization_id": {"type": "keyword"},
+                "target_entities": {
+                    "type": "nested",
+                    "properties": {
+                        "id": {"type": "keyword"},
+                        "type": {"type": "keyword"},
+                    },
+                },
+                "embedding_vector": {
+                    "type": "dense_vector",
+                    "dims": settings.embedding_dimension,
+                },
+            }
+        },
+    },
+}
+
+LATEST_INDEX_VERSION = max(INDEX_DEFINITIONS)
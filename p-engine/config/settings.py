@@ -21,6 +21,12 @@ class Settings(BaseSettings):
     elasticsearch_password: str = "b1V4R0Re"
     elasticsearch_index: str = "audit_logs"
 
+    # Index management
+    index_number_of_replicas: int = 1
+    index_refresh_interval: str = "1s"
+    index_bulk_chunk_size: int = 500
+    index_request_timeout: int = 600
+
     # Embedding Model
     embedding_model_name: str = "all-MiniLM-L6-v2"
     embedding_dimension: int = 384
@@ -30,6 +36,21 @@ class Settings(BaseSettings):
     knn_k: int = 10
     knn_num_candidates: int = 100
 
+    # Admission control for embedding work
+    admission_max_concurrency: int = 2
+    admission_queue_limit_interactive: int = 16
+    admission_queue_limit_batch: int = 4
+    admission_deadline_interactive: float = 2.0
+    admission_deadline_batch: float = 0.5
+    admission_retry_after: int = 1
+    admission_degrade_to_keyword: bool = False
+
+    # Export
+    export_slices: int = 4
+    export_batch_size: int = 1000
+    export_max_buffered_batches: int = 8
+    export_pit_keep_alive: str = "2m"
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
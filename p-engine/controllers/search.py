@@ -1,31 +1,67 @@
 """Controller for search and embedding endpoints."""
 
-from typing import Any, Dict, List, Literal
+import json
+from typing import Any, AsyncIterator, Dict, List, Literal, Tuple
 
 from elasticsearch import Elasticsearch
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sentence_transformers import SentenceTransformer
+from starlette.background import BackgroundTask
 
-from ..dependencies import get_elasticsearch, get_embedding_model
+from ..config import settings
+from ..dependencies import (
+    get_admission_controller,
+    get_elasticsearch,
+    get_embedding_model,
+)
 from ..models import VectorResponse
-from ..services import EmbeddingService, SearchService
+from ..services import (
+    EXPORT_FORMATS,
+    AdmissionController,
+    EmbeddingService,
+    ExportService,
+    OverloadedError,
+    Priority,
+    ProgressiveSearchService,
+    SearchService,
+)
 
 router = APIRouter(tags=["search"])
 
 
 def get_embedding_service(
     model: SentenceTransformer = Depends(get_embedding_model),
+    admission_controller: AdmissionController = Depends(get_admission_controller),
 ) -> EmbeddingService:
     """
     Get embedding service instance.
 
     Args:
         model: SentenceTransformer model from dependencies
+        admission_controller: Limiter guarding the model from dependencies
 
     Returns:
         EmbeddingService instance
     """
-    return EmbeddingService(model)
+    return EmbeddingService(model, admission_controller)
+
+
+def _service_unavailable(error: OverloadedError) -> HTTPException:
+    """
+    Build the 503 response for a request shed by admission control.
+
+    Args:
+        error: The admission error
+
+    Returns:
+        HTTPException with a ``Retry-After`` header
+    """
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": str(error.retry_after)},
+    )
 
 
 def get_search_service(
@@ -45,6 +81,36 @@ def get_search_service(
     return SearchService(es_client, embedding_service)
 
 
+def get_progressive_search_service(
+    search_service: SearchService = Depends(get_search_service),
+) -> ProgressiveSearchService:
+    """
+    Get progressive search service instance.
+
+    Args:
+        search_service: Search service from dependencies
+
+    Returns:
+        ProgressiveSearchService instance
+    """
+    return ProgressiveSearchService(search_service)
+
+
+def get_export_service(
+    es_client: Elasticsearch = Depends(get_elasticsearch),
+) -> ExportService:
+    """
+    Get export service instance.
+
+    Args:
+        es_client: Elasticsearch client from dependencies
+
+    Returns:
+        ExportService instance
+    """
+    return ExportService(es_client)
+
+
 @router.get(
     "/get_vector/", response_model=VectorResponse, status_code=status.HTTP_200_OK
 )
@@ -63,17 +129,20 @@ def get_vector(
         VectorResponse with text and embedding vector
 
     Raises:
-        HTTPException: If text is empty or invalid
+        HTTPException: If text is empty or invalid, or the service is overloaded
     """
     try:
-        embedding = embedding_service.generate_embedding(text)
+        embedding = embedding_service.generate_embedding(text, priority=Priority.BATCH)
         return VectorResponse(text=text, vector=embedding)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except OverloadedError as e:
+        raise _service_unavailable(e)
 
 
 @router.get("/search", status_code=status.HTTP_200_OK)
 def search_logs(
+    response: Response,
     query: str = Query(default="", description="Search query text"),
     search_type: Literal["keyword", "semantic", "hybrid"] = Query(
         default="keyword", description="Type of search to perform"
@@ -83,7 +152,12 @@ def search_logs(
     """
     Search audit logs in Elasticsearch.
 
+    When the embedding model is overloaded, semantic and hybrid searches are
+    rejected with 503, or answered with keyword results (flagged by the
+    ``X-Search-Degraded`` header) if ``admission_degrade_to_keyword`` is set.
+
     Args:
+        response: Response used to flag degraded results
         query: Search query text
         search_type: Type of search ('keyword', 'semantic', or 'hybrid')
         search_service: Service for performing searches
@@ -92,15 +166,147 @@ def search_logs(
         List of matching audit log documents
 
     Raises:
-        HTTPException: If search type is invalid or search fails
+        HTTPException: If search type is invalid, the service is overloaded
+            or search fails
+    """
+    try:
+        try:
+            return search_service.search(query=query, search_type=search_type)
+        except OverloadedError as e:
+            if not settings.admission_degrade_to_keyword:
+                raise _service_unavailable(e)
+            response.headers["X-Search-Degraded"] = "keyword"
+            return search_service.search(query=query, search_type="keyword")
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Search failed: {str(e)}",
+        )
+
+
+async def _sse_events(
+    events: AsyncIterator[Tuple[str, Dict[str, Any]]],
+) -> AsyncIterator[str]:
+    """
+    Format (event name, payload) tuples as Server-Sent Events.
+
+    Failures after the stream has started are reported as a ``search_error``
+    event because the response status has already been sent.
+    """
+    try:
+        async for event, payload in events:
+            yield f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+    except OverloadedError as e:
+        payload = {"detail": str(e), "retry_after": e.retry_after}
+        yield f"event: search_error\ndata: {json.dumps(payload)}\n\n"
+    except Exception as e:
+        payload = {"detail": f"Search failed: {str(e)}"}
+        yield f"event: search_error\ndata: {json.dumps(payload)}\n\n"
+
+
+@router.get("/search/stream", status_code=status.HTTP_200_OK)
+async def stream_search_logs(
+    query: str = Query(default="", description="Search query text"),
+    search_type: Literal["keyword", "semantic", "hybrid"] = Query(
+        default="keyword", description="Type of search to perform"
+    ),
+    progressive_search_service: ProgressiveSearchService = Depends(
+        get_progressive_search_service
+    ),
+) -> StreamingResponse:
+    """
+    Stream search results over Server-Sent Events.
+
+    Hybrid searches send keyword hits first (``results``) and the fused
+    ranking once the vector leg finishes (``rerank``, as a delta). The final
+    ``done`` event reports time to first result and total latency. Requests
+    shed by admission control before any results exist get 503; a vector leg
+    shed after keyword hits were sent is reported as a ``search_error`` event.
+
+    Args:
+        query: Search query text
+        search_type: Type of search ('keyword', 'semantic', or 'hybrid')
+        progressive_search_service: Service for streaming searches
+
+    Returns:
+        StreamingResponse with a ``text/event-stream`` body
+
+    Raises:
+        HTTPException: If search type is invalid, the query is empty, the
+            service is overloaded or the search fails before streaming
     """
     try:
-        results = search_service.search(query=query, search_type=search_type)
-        return results
+        events = await progressive_search_service.stream(
+            query=query, search_type=search_type
+        )
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except OverloadedError as e:
+        raise _service_unavailable(e)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Search failed: {str(e)}",
         )
+
+    return StreamingResponse(
+        _sse_events(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/search/export", status_code=status.HTTP_200_OK)
+def export_logs(
+    query: str = Query(default="", description="Search query text"),
+    search_type: Literal["keyword", "semantic", "hybrid"] = Query(
+        default="keyword", description="Type of search to perform"
+    ),
+    export_format: Literal["ndjson", "arrow", "parquet"] = Query(
+        default="ndjson", alias="format", description="Output format"
+    ),
+    export_service: ExportService = Depends(get_export_service),
+) -> StreamingResponse:
+    """
+    Stream every audit log matching a search.
+
+    Args:
+        query: Search query text
+        search_type: Type of search, only 'keyword' can be exported
+        export_format: Output format ('ndjson', 'arrow' or 'parquet')
+        export_service: Service for exporting search results
+
+    Returns:
+        StreamingResponse with the encoded audit logs
+
+    Raises:
+        HTTPException: If the export is invalid or cannot be started
+    """
+    try:
+        chunks = export_service.export(
+            query=query, search_type=search_type, export_format=export_format
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Export failed: {str(e)}",
+        )
+
+    # Closing after the response also releases the point-in-time when the
+    # client disconnects before the first chunk is read
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_FORMATS[export_format],
+        background=BackgroundTask(chunks.close),
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="{export_service.index_name}.{export_format}"'
+            )
+        },
+    )
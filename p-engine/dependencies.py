@@ -4,6 +4,7 @@ from elasticsearch import Elasticsearch
 from sentence_transformers import SentenceTransformer
 
 from .config import settings
+from .services.admission_controller import AdmissionController, Priority
 
 
 class DependencyContainer:
@@ -11,6 +12,7 @@ class DependencyContainer:
 
     _elasticsearch: Elasticsearch | None = None
     _embedding_model: SentenceTransformer | None = None
+    _admission_controller: AdmissionController | None = None
 
     @classmethod
     def get_elasticsearch(cls) -> Elasticsearch:
@@ -32,6 +34,24 @@ class DependencyContainer:
             cls._embedding_model = SentenceTransformer(settings.embedding_model_name)
         return cls._embedding_model
 
+    @classmethod
+    def get_admission_controller(cls) -> AdmissionController:
+        """Get or create the admission controller guarding the embedding model."""
+        if cls._admission_controller is None:
+            cls._admission_controller = AdmissionController(
+                max_concurrency=settings.admission_max_concurrency,
+                queue_limits={
+                    Priority.INTERACTIVE: settings.admission_queue_limit_interactive,
+                    Priority.BATCH: settings.admission_queue_limit_batch,
+                },
+                deadlines={
+                    Priority.INTERACTIVE: settings.admission_deadline_interactive,
+                    Priority.BATCH: settings.admission_deadline_batch,
+                },
+                retry_after=settings.admission_retry_after,
+            )
+        return cls._admission_controller
+
     @classmethod
     def close(cls):
         """Close all connections and cleanup resources."""
@@ -50,3 +70,8 @@ def get_elasticsearch() -> Elasticsearch:
 def get_embedding_model() -> SentenceTransformer:
     """FastAPI dependency for embedding model."""
     return DependencyContainer.get_embedding_model()
+
+
+def get_admission_controller() -> AdmissionController:
+    """FastAPI dependency for the embedding admission controller."""
+    return DependencyContainer.get_admission_controller()
@@ -23,6 +23,7 @@ async def lifespan(app: FastAPI):
     # Startup: Initialize dependencies
     DependencyContainer.get_elasticsearch()
     DependencyContainer.get_embedding_model()
+    DependencyContainer.get_admission_controller()
     yield
     # Shutdown: Clean up resources
     DependencyContainer.close()
@@ -59,3 +60,14 @@ def read_root():
         Dictionary with a welcome message
     """
     return {"message": f"Welcome to {settings.app_name}", "status": "healthy"}
+
+
+@app.get("/health/admission", tags=["health"])
+def read_admission_stats():
+    """
+    Admission control statistics for the embedding model.
+
+    Returns:
+        Dictionary with active slots, queue depth, wait times and shed counts
+    """
+    return DependencyContainer.get_admission_controller().stats()
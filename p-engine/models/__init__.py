@@ -2,6 +2,7 @@
 
 from .schemas import (
     AuditLog,
+    IndexBuildReport,
     Item,
     SearchRequest,
     SearchResponse,
@@ -16,4 +17,5 @@ __all__ = [
     "SearchRequest",
     "SearchResponse",
     "AuditLog",
+    "IndexBuildReport",
 ]
@@ -94,3 +94,25 @@ class SearchResponse(BaseModel):
                 "total": 1,
             }
         }
+
+
+class IndexBuildReport(BaseModel):
+    """Summary of a physical index build behind the search alias."""
+
+    alias: str = Field(..., description="Alias that serves search traffic")
+    index: str = Field(..., description="Name of the newly built physical index")
+    version: int = Field(..., description="Index definition version used")
+    previous_indices: List[str] = Field(
+        default_factory=list, description="Indices the alias pointed to before"
+    )
+    documents_indexed: int = Field(..., description="Documents loaded successfully")
+    documents_failed: int = Field(..., description="Documents rejected by bulk")
+    load_seconds: float = Field(..., description="Wall time of the bulk load")
+    docs_per_second: float = Field(..., description="Bulk load throughput")
+    segments_before_merge: int = Field(
+        ..., description="Primary segment count before force-merge"
+    )
+    segments_after_merge: int = Field(
+        ..., description="Primary segment count after force-merge"
+    )
+    merge_seconds: float = Field(..., description="Wall time of the force-merge")
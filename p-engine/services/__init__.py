@@ -1,6 +1,21 @@
 """Services package for business logic."""
 
+from .admission_controller import AdmissionController, OverloadedError, Priority
 from .embedding_service import EmbeddingService
+from .export_service import EXPORT_FORMATS, ExportService, ExportStream
+from .index_service import IndexService
+from .progressive_search_service import ProgressiveSearchService
 from .search_service import SearchService
 
-__all__ = ["EmbeddingService", "SearchService"]
+__all__ = [
+    "AdmissionController",
+    "EmbeddingService",
+    "EXPORT_FORMATS",
+    "ExportService",
+    "ExportStream",
+    "IndexService",
+    "OverloadedError",
+    "Priority",
+    "ProgressiveSearchService",
+    "SearchService",
+]
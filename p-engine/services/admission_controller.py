@@ -0,0 +1,175 @@
+"""Admission control for CPU-bound embedding work."""
+
+import threading
+import time
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Any, Dict, Iterator, Optional
+
+
+class Priority(IntEnum):
+    """Priority classes for embedding work, lower values are admitted first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+class OverloadedError(Exception):
+    """Raised when a request cannot be admitted before its deadline."""
+
+    def __init__(self, message: str, retry_after: int):
+        """
+        Initialize the error.
+
+        Args:
+            message: Human readable reason the request was shed
+            retry_after: Seconds the client should wait before retrying
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Concurrency limiter with bounded, prioritized queues and deadlines.
+
+    At most ``max_concurrency`` callers hold a slot at once. Callers that
+    cannot start immediately wait in a bounded queue for their priority class
+    and are shed with ``OverloadedError`` when the queue is full or their
+    deadline passes. Waiting callers of a lower priority are only admitted
+    while no higher priority caller is queued.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        queue_limits: Dict[Priority, int],
+        deadlines: Dict[Priority, float],
+        retry_after: int = 1,
+    ):
+        """
+        Initialize the admission controller.
+
+        Args:
+            max_concurrency: Maximum number of concurrently admitted callers
+            queue_limits: Maximum number of waiting callers per priority
+            deadlines: Default seconds a caller may wait, per priority
+            retry_after: Seconds reported to shed clients in ``Retry-After``
+        """
+        self.max_concurrency = max_concurrency
+        self.queue_limits = queue_limits
+        self.deadlines = deadlines
+        self.retry_after = retry_after
+
+        self._condition = threading.Condition()
+        self._active = 0
+        self._waiting = {priority: 0 for priority in Priority}
+        self._admitted = {priority: 0 for priority in Priority}
+        self._shed_queue_full = {priority: 0 for priority in Priority}
+        self._shed_deadline = {priority: 0 for priority in Priority}
+        self._wait_seconds_total = {priority: 0.0 for priority in Priority}
+        self._wait_seconds_max = {priority: 0.0 for priority in Priority}
+
+    @contextmanager
+    def slot(
+        self,
+        priority: Priority = Priority.INTERACTIVE,
+        deadline: Optional[float] = None,
+    ) -> Iterator[None]:
+        """
+        Hold an admission slot for the duration of the block.
+
+        Args:
+            priority: Priority class of the caller
+            deadline: Seconds the caller may wait, defaults to the class default
+
+        Raises:
+            OverloadedError: If the caller cannot be admitted in time
+        """
+        self._acquire(
+            priority, self.deadlines[priority] if deadline is None else deadline
+        )
+        try:
+            yield
+        finally:
+            self._release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the admission counters.
+
+        Returns:
+            Dictionary with active slots and per-priority queue depth, admitted
+            and shed counts and wait times in milliseconds
+        """
+        with self._condition:
+            classes = {}
+            for priority in Priority:
+                admitted = self._admitted[priority]
+                wait_total = self._wait_seconds_total[priority]
+                wait_avg = wait_total / admitted if admitted else 0.0
+                classes[priority.name.lower()] = {
+                    "queue_depth": self._waiting[priority],
+                    "queue_limit": self.queue_limits[priority],
+                    "admitted": admitted,
+                    "shed_queue_full": self._shed_queue_full[priority],
+                    "shed_deadline": self._shed_deadline[priority],
+                    "wait_ms_avg": round(wait_avg * 1000, 2),
+                    "wait_ms_max": round(self._wait_seconds_max[priority] * 1000, 2),
+                }
+            return {
+                "max_concurrency": self.max_concurrency,
+                "active": self._active,
+                "classes": classes,
+            }
+
+    def _can_start(self, priority: Priority) -> bool:
+        """Whether a caller may start now without jumping a higher priority."""
+        if self._active >= self.max_concurrency:
+            return False
+        return not any(self._waiting[p] for p in Priority if p < priority)
+
+    def _acquire(self, priority: Priority, deadline: float) -> None:
+        """Wait for a slot, shedding the caller when that is not possible."""
+        start = time.monotonic()
+        with self._condition:
+            if not self._waiting[priority] and self._can_start(priority):
+                self._admit(priority, 0.0)
+                return
+
+            if self._waiting[priority] >= self.queue_limits[priority]:
+                self._shed_queue_full[priority] += 1
+                raise OverloadedError(
+                    f"Embedding queue for {priority.name.lower()} requests is full",
+                    self.retry_after,
+                )
+
+            self._waiting[priority] += 1
+            try:
+                while not self._can_start(priority):
+                    remaining = start + deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._shed_deadline[priority] += 1
+                        raise OverloadedError(
+                            f"Request could not start within {deadline:g}s",
+                            self.retry_after,
+                        )
+                    self._condition.wait(remaining)
+            finally:
+                self._waiting[priority] -= 1
+                # Lower priority waiters may be unblocked by this one leaving
+                self._condition.notify_all()
+
+            self._admit(priority, time.monotonic() - start)
+
+    def _admit(self, priority: Priority, waited: float) -> None:
+        """Record an admission, must be called with the condition held."""
+        self._active += 1
+        self._admitted[priority] += 1
+        self._wait_seconds_total[priority] += waited
+        self._wait_seconds_max[priority] = max(self._wait_seconds_max[priority], waited)
+
+    def _release(self) -> None:
+        """Free a slot and wake waiting callers."""
+        with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
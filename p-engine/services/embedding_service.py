@@ -1,57 +1,74 @@
 """Service for handling vector embeddings."""
 
-from typing import List
+from contextlib import nullcontext
+from typing import ContextManager, List, Optional
 
 from sentence_transformers import SentenceTransformer
 
 from ..config import settings
+from .admission_controller import AdmissionController, Priority
 
 
 class EmbeddingService:
     """Service for generating and managing vector embeddings."""
 
-    def __init__(self, model: SentenceTransformer):
+    def __init__(
+        self,
+        model: SentenceTransformer,
+        admission_controller: Optional[AdmissionController] = None,
+    ):
         """
         Initialize the embedding service.
 
         Args:
             model: SentenceTransformer model instance
+            admission_controller: Optional limiter guarding calls to the model
         """
         self.model = model
+        self.admission_controller = admission_controller
         self.dimension = settings.embedding_dimension
 
-    def generate_embedding(self, text: str) -> List[float]:
+    def generate_embedding(
+        self, text: str, priority: Priority = Priority.INTERACTIVE
+    ) -> List[float]:
         """
         Generate a vector embedding for the given text.
 
         Args:
             text: Input text to encode
+            priority: Admission priority of the request
 
         Returns:
             List of floats representing the embedding vector
 
         Raises:
             ValueError: If text is empty
+            OverloadedError: If the request is shed by admission control
         """
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
         text = text.strip()
-        embedding = self.model.encode(text)
+        with self._admit(priority):
+            embedding = self.model.encode(text)
         return embedding.tolist()
 
-    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+    def generate_embeddings_batch(
+        self, texts: List[str], priority: Priority = Priority.BATCH
+    ) -> List[List[float]]:
         """
         Generate embeddings for multiple texts in batch.
 
         Args:
             texts: List of input texts
+            priority: Admission priority of the request
 
         Returns:
             List of embedding vectors
 
         Raises:
             ValueError: If texts list is empty
+            OverloadedError: If the request is shed by admission control
         """
         if not texts:
             raise ValueError("Texts list cannot be empty")
@@ -62,7 +79,8 @@ class EmbeddingService:
         if not cleaned_texts:
             raise ValueError("All texts are empty after stripping whitespace")
 
-        embeddings = self.model.encode(cleaned_texts)
+        with self._admit(priority):
+            embeddings = self.model.encode(cleaned_texts)
         return [emb.tolist() for emb in embeddings]
 
     def get_embedding_dimension(self) -> int:
@@ -73,3 +91,17 @@ class EmbeddingService:
             Integer representing the embedding dimension
         """
         return self.dimension
+
+    def _admit(self, priority: Priority) -> ContextManager[None]:
+        """
+        Get the admission slot guarding a call to the model.
+
+        Args:
+            priority: Admission priority of the request
+
+        Returns:
+            Context manager holding a slot, or a no-op without a controller
+        """
+        if self.admission_controller is None:
+            return nullcontext()
+        return self.admission_controller.slot(priority)
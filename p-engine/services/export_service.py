@@ -0,0 +1,334 @@
+"""Service for streaming bulk exports of search results."""
+
+import io
+import json
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from elasticsearch import Elasticsearch
+
+from ..config import settings
+from .search_service import SearchService
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+EXPORT_FIELDS = [
+    "id",
+    "action",
+    "summary",
+    "description",
+    "ip_address",
+    "occured_at",
+    "created_at",
+    "actor_id",
+    "organization_id",
+    "target_entities",
+]
+
+_SLICE_DONE = object()
+
+
+def _arrow_schema() -> "pa.Schema":
+    """Build the Arrow schema for exported audit logs."""
+    target_entity = pa.struct([("id", pa.string()), ("type", pa.string())])
+    return pa.schema(
+        [
+            (field, pa.list_(target_entity))
+            if field == "target_entities"
+            else (field, pa.string())
+            for field in EXPORT_FIELDS
+        ]
+    )
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object whose written bytes can be drained incrementally."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ExportStream:
+    """Iterator over encoded export chunks that owns the point-in-time.
+
+    The point-in-time is closed when the stream is exhausted, fails or is
+    closed, including when iteration never started, e.g. because the client
+    disconnected before the first chunk was sent.
+    """
+
+    def __init__(self, chunks: Iterator[bytes], close_pit: Callable[[], Any]):
+        """
+        Initialize the stream.
+
+        Args:
+            chunks: Generator producing the encoded chunks
+            close_pit: Callback closing the point-in-time
+        """
+        self._chunks = chunks
+        self._close_pit = close_pit
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def __iter__(self) -> "ExportStream":
+        return self
+
+    def __next__(self) -> bytes:
+        try:
+            return next(self._chunks)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Stop the slice workers and close the point-in-time, once."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self._chunks.close()
+        finally:
+            self._close_pit()
+
+    def __del__(self):
+        # Last resort for streams dropped without being closed
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class ExportService:
+    """Service for exporting every document matching a search."""
+
+    def __init__(self, es_client: Elasticsearch):
+        """
+        Initialize the export service.
+
+        Args:
+            es_client: Elasticsearch client instance
+        """
+        self.es = es_client
+        self.index_name = settings.elasticsearch_index
+
+    def export(
+        self,
+        query: str = "",
+        search_type: str = "keyword",
+        export_format: str = "ndjson",
+    ) -> ExportStream:
+        """
+        Export all audit logs matching a search as a stream of encoded chunks.
+
+        Validation and opening the point-in-time happen eagerly so errors can
+        be reported before the first byte is streamed. Documents are read with
+        sliced ``search_after`` pagination in parallel, and at most
+        ``export_max_buffered_batches`` batches are held in memory at once.
+        Callers that may not exhaust the stream must ``close()`` it to release
+        the point-in-time promptly.
+
+        Args:
+            query: Search query text
+            search_type: Type of search, only 'keyword' can be exported
+            export_format: Output format ('ndjson', 'arrow' or 'parquet')
+
+        Returns:
+            ExportStream over encoded output chunks
+
+        Raises:
+            ValueError: If the search type or format is not supported
+        """
+        if search_type != "keyword":
+            raise ValueError(
+                f"Export does not support search_type: {search_type}. "
+                "Semantic and hybrid results are capped at knn_k hits, "
+                "use 'keyword' to export every matching log"
+            )
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(
+                f"Invalid export format: {export_format}. "
+                f"Must be one of {', '.join(EXPORT_FORMATS)}"
+            )
+        if export_format != "ndjson" and pa is None:
+            raise ValueError(
+                f"The '{export_format}' format requires pyarrow, "
+                "install the 'export' extra"
+            )
+
+        es_query = SearchService.build_keyword_query(query.strip())
+        pit_id = self.es.open_point_in_time(
+            index=self.index_name, keep_alive=settings.export_pit_keep_alive
+        )["id"]
+        batches = self._iter_batches(pit_id, es_query)
+
+        if export_format == "arrow":
+            chunks = self._encode_arrow(batches)
+        elif export_format == "parquet":
+            chunks = self._encode_parquet(batches)
+        else:
+            chunks = self._encode_ndjson(batches)
+        return ExportStream(chunks, lambda: self.es.close_point_in_time(id=pit_id))
+
+    def _iter_batches(
+        self, pit_id: str, es_query: Dict[str, Any]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Walk all slices of a point-in-time in parallel.
+
+        Args:
+            pit_id: Point-in-time ID to search
+            es_query: Elasticsearch query clause
+
+        Yields:
+            Batches of document sources, in no particular order
+        """
+        slices = max(settings.export_slices, 1)
+        buffer: queue.Queue = queue.Queue(maxsize=settings.export_max_buffered_batches)
+        stop = threading.Event()
+
+        with ThreadPoolExecutor(
+            max_workers=slices, thread_name_prefix="export-slice"
+        ) as executor:
+            for slice_id in range(slices):
+                executor.submit(
+                    self._scan_slice,
+                    pit_id,
+                    es_query,
+                    slice_id,
+                    slices,
+                    buffer,
+                    stop,
+                )
+            try:
+                remaining = slices
+                while remaining:
+                    item = buffer.get()
+                    if item is _SLICE_DONE:
+                        remaining -= 1
+                    elif isinstance(item, Exception):
+                        raise item
+                    else:
+                        yield item
+            finally:
+                stop.set()
+
+    def _scan_slice(
+        self,
+        pit_id: str,
+        es_query: Dict[str, Any],
+        slice_id: int,
+        slices: int,
+        buffer: queue.Queue,
+        stop: threading.Event,
+    ) -> None:
+        """
+        Page through one slice with ``search_after`` and buffer its batches.
+
+        Args:
+            pit_id: Point-in-time ID to search
+            es_query: Elasticsearch query clause
+            slice_id: ID of the slice to scan
+            slices: Total number of slices
+            buffer: Bounded queue shared with the consumer
+            stop: Event set when the consumer stops reading
+        """
+        search_after: Optional[List[Any]] = None
+        try:
+            while not stop.is_set():
+                body: Dict[str, Any] = {
+                    "query": es_query,
+                    "pit": {"id": pit_id, "keep_alive": settings.export_pit_keep_alive},
+                    "sort": [{"_shard_doc": "asc"}],
+                    "size": settings.export_batch_size,
+                    "_source": EXPORT_FIELDS,
+                    "track_total_hits": False,
+                }
+                if slices > 1:
+                    body["slice"] = {"id": slice_id, "max": slices}
+                if search_after is not None:
+                    body["search_after"] = search_after
+
+                response = self.es.search(body=body)
+                pit_id = response.get("pit_id", pit_id)
+                hits = response["hits"]["hits"]
+                if not hits:
+                    break
+
+                self._put(buffer, stop, [hit["_source"] for hit in hits])
+                if len(hits) < settings.export_batch_size:
+                    break
+                search_after = hits[-1]["sort"]
+        except Exception as e:
+            self._put(buffer, stop, e)
+        finally:
+            self._put(buffer, stop, _SLICE_DONE)
+
+    @staticmethod
+    def _put(buffer: queue.Queue, stop: threading.Event, item: Any) -> None:
+        """Put an item on the buffer, giving up once the consumer has stopped."""
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    @staticmethod
+    def _encode_ndjson(batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+        """Encode batches as newline-delimited JSON."""
+        for batch in batches:
+            yield "".join(json.dumps(doc) + "\n" for doc in batch).encode("utf-8")
+
+    @staticmethod
+    def _encode_arrow(batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+        """Encode batches as an Arrow IPC stream, one record batch per batch."""
+        schema = _arrow_schema()
+        sink = _ChunkSink()
+        with pa.ipc.new_stream(sink, schema) as writer:
+            for batch in batches:
+                writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+                yield sink.drain()
+        yield sink.drain()
+
+    @staticmethod
+    def _encode_parquet(batches: Iterator[List[Dict[str, Any]]]) -> Iterator[bytes]:
+        """Encode batches as a Parquet file, one row group per batch."""
+        schema = _arrow_schema()
+        sink = _ChunkSink()
+        with pq.ParquetWriter(sink, schema) as writer:
+            for batch in batches:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                yield sink.drain()
+        yield sink.drain()
@@ -0,0 +1,294 @@
+"""Service for managing the lifecycle of the audit log index."""
+
+import json
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from elasticsearch import Elasticsearch
+from elasticsearch.helpers import streaming_bulk
+
+from ..config import INDEX_DEFINITIONS, LATEST_INDEX_VERSION, settings
+from ..models import IndexBuildReport
+
+
+class IndexService:
+    """Service for building versioned indices behind the search alias."""
+
+    def __init__(self, es_client: Elasticsearch):
+        """
+        Initialize the index service.
+
+        Args:
+            es_client: Elasticsearch client instance
+        """
+        self.es = es_client.options(request_timeout=settings.index_request_timeout)
+        self.alias = settings.elasticsearch_index
+
+    def get_definition(self, version: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get the index definition for a version.
+
+        Args:
+            version: Definition version, defaults to the latest one
+
+        Returns:
+            Dictionary with the index settings and mappings
+
+        Raises:
+            ValueError: If the version is unknown
+        """
+        version = LATEST_INDEX_VERSION if version is None else version
+        if version not in INDEX_DEFINITIONS:
+            raise ValueError(
+                f"Unknown index version: {version}. "
+                f"Available versions: {sorted(INDEX_DEFINITIONS)}"
+            )
+        return INDEX_DEFINITIONS[version]
+
+    def get_alias_indices(self) -> List[str]:
+        """
+        Get the physical indices the alias currently points to.
+
+        Returns:
+            List of index names, empty if the alias does not exist
+        """
+        if not self.es.indices.exists_alias(name=self.alias):
+            return []
+        return sorted(self.es.indices.get_alias(name=self.alias).keys())
+
+    def count_segments(self, index: str) -> int:
+        """
+        Count the segments held by the primary shards of an index.
+
+        Args:
+            index: Physical index name
+
+        Returns:
+            Number of primary segments
+        """
+        response = self.es.indices.segments(index=index)
+        shards = response["indices"][index]["shards"]
+        return sum(
+            len(copy["segments"])
+            for copies in shards.values()
+            for copy in copies
+            if copy["routing"]["primary"]
+        )
+
+    def build(
+        self,
+        source_path: str,
+        version: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        delete_old: bool = False,
+        max_failures: int = 0,
+    ) -> IndexBuildReport:
+        """
+        Build a new physical index and swap the alias onto it.
+
+        The index is created with refreshes disabled and no replicas, bulk
+        loaded, force-merged, restored to its serving settings and only then
+        exposed through the alias in a single atomic alias update. If the load
+        indexes no documents or rejects more than ``max_failures`` of them, the
+        new index is deleted and the alias is left untouched.
+
+        Args:
+            source_path: Path to a bulk NDJSON file (action and document lines)
+            version: Index definition version, defaults to the latest one
+            chunk_size: Number of documents per bulk request
+            delete_old: Whether to delete the indices previously behind the alias
+            max_failures: Number of rejected documents tolerated by the build
+
+        Returns:
+            IndexBuildReport describing the build
+
+        Raises:
+            ValueError: If the version is unknown, the bulk file is malformed or
+                the load failed
+        """
+        version = LATEST_INDEX_VERSION if version is None else version
+        definition = self.get_definition(version)
+        chunk_size = chunk_size or settings.index_bulk_chunk_size
+
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+        index = f"{self.alias}-v{version}-{timestamp}"
+
+        self.es.indices.create(
+            index=index,
+            settings={
+                **definition["settings"],
+                "refresh_interval": "-1",
+                "number_of_replicas": 0,
+            },
+            mappings=definition["mappings"],
+        )
+
+        try:
+            load_start = time.perf_counter()
+            indexed, failed = self._bulk_load(index, source_path, chunk_size)
+            load_seconds = time.perf_counter() - load_start
+
+            if failed > max_failures:
+                raise ValueError(
+                    f"Bulk load rejected {failed} documents "
+                    f"(max_failures={max_failures}), alias left unchanged"
+                )
+            if not indexed:
+                raise ValueError("Bulk load indexed no documents, alias left unchanged")
+
+            self.es.indices.refresh(index=index)
+            segments_before = self.count_segments(index)
+
+            merge_start = time.perf_counter()
+            self.es.indices.forcemerge(index=index, max_num_segments=1)
+            merge_seconds = time.perf_counter() - merge_start
+            segments_after = self.count_segments(index)
+
+            self.es.indices.put_settings(
+                index=index,
+                settings={
+                    "refresh_interval": settings.index_refresh_interval,
+                    "number_of_replicas": settings.index_number_of_replicas,
+                },
+            )
+            previous = self._swap_alias(index)
+        except Exception:
+            self.es.indices.delete(index=index, ignore_unavailable=True)
+            raise
+
+        if delete_old and previous:
+            self.es.indices.delete(index=",".join(previous), ignore_unavailable=True)
+
+        throughput = indexed / load_seconds if load_seconds else 0.0
+        return IndexBuildReport(
+            alias=self.alias,
+            index=index,
+            version=version,
+            previous_indices=previous,
+            documents_indexed=indexed,
+            documents_failed=failed,
+            load_seconds=round(load_seconds, 3),
+            docs_per_second=round(throughput, 1),
+            segments_before_merge=segments_before,
+            segments_after_merge=segments_after,
+            merge_seconds=round(merge_seconds, 3),
+        )
+
+    def _bulk_load(
+        self, index: str, source_path: str, chunk_size: int
+    ) -> Tuple[int, int]:
+        """
+        Stream the documents of a bulk file into an index.
+
+        Args:
+            index: Target physical index name
+            source_path: Path to a bulk NDJSON file
+            chunk_size: Number of documents per bulk request
+
+        Returns:
+            Tuple of (indexed document count, failed document count)
+        """
+        indexed = failed = 0
+        for ok, _ in streaming_bulk(
+            self.es,
+            self._read_bulk_file(index, source_path),
+            chunk_size=chunk_size,
+            raise_on_error=False,
+        ):
+            if ok:
+                indexed += 1
+            else:
+                failed += 1
+        return indexed, failed
+
+    def _read_bulk_file(self, index: str, source_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Read bulk actions from a file, retargeting them at a new index.
+
+        Args:
+            index: Target physical index name
+            source_path: Path to a bulk NDJSON file
+
+        Yields:
+            Bulk action dictionaries for the streaming bulk helper
+        """
+        with open(source_path, "r") as f:
+            lines = enumerate(f, start=1)
+            for line_number, action_line in lines:
+                if not action_line.strip():
+                    continue
+                action = self._parse_bulk_line(action_line, source_path, line_number)
+                op_type = next(iter(action), None)
+                if op_type == "delete":
+                    # Deletes have no document line and nothing to delete
+                    # from a freshly created index
+                    continue
+                if op_type not in ("index", "create"):
+                    raise ValueError(
+                        f"{source_path}:{line_number}: unsupported bulk action "
+                        f"{op_type!r}, expected 'index' or 'create'"
+                    )
+
+                doc_line_number, doc_line = next(lines, (line_number + 1, ""))
+                if not doc_line.strip():
+                    raise ValueError(
+                        f"{source_path}:{doc_line_number}: missing document for "
+                        f"the {op_type!r} action on line {line_number}"
+                    )
+                doc = self._parse_bulk_line(doc_line, source_path, doc_line_number)
+                yield {
+                    "_index": index,
+                    "_id": action[op_type].get("_id", doc.get("id")),
+                    "_source": doc,
+                }
+
+    @staticmethod
+    def _parse_bulk_line(
+        line: str, source_path: str, line_number: int
+    ) -> Dict[str, Any]:
+        """
+        Parse one line of a bulk file as a JSON object.
+
+        Args:
+            line: Raw line content
+            source_path: Path to the bulk file, for error messages
+            line_number: 1-based line number, for error messages
+
+        Returns:
+            Parsed JSON object
+
+        Raises:
+            ValueError: If the line is not a JSON object
+        """
+        try:
+            parsed = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{source_path}:{line_number}: invalid JSON: {e}")
+        if not isinstance(parsed, dict):
+            raise ValueError(f"{source_path}:{line_number}: expected a JSON object")
+        return parsed
+
+    def _swap_alias(self, index: str) -> List[str]:
+        """
+        Atomically point the alias at a new index.
+
+        A concrete index that still carries the alias name (as created by
+        older versions of ``seed.sh``) is removed in the same alias update.
+
+        Args:
+            index: Physical index that should serve the alias
+
+        Returns:
+            List of indices the alias pointed to before the swap
+        """
+        previous = self.get_alias_indices()
+        actions: List[Dict[str, Any]] = [
+            {"remove": {"index": old, "alias": self.alias}} for old in previous
+        ]
+        if not previous and self.es.indices.exists(index=self.alias):
+            actions.append({"remove_index": {"index": self.alias}})
+        actions.append({"add": {"index": index, "alias": self.alias}})
+
+        self.es.indices.update_aliases(actions=actions)
+        return previous
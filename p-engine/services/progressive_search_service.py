@@ -0,0 +1,221 @@
+"""Service for streaming search results progressively."""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from ..config import settings
+from .admission_controller import OverloadedError
+from .search_service import SearchService
+
+
+def compute_rank_delta(
+    previous_ids: List[str], hits: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Express a new ranking as a delta against results already sent.
+
+    Args:
+        previous_ids: Document IDs in the order the client already has
+        hits: Elasticsearch hits of the new ranking
+
+    Returns:
+        Dictionary with the new ``order`` of IDs, the ``added`` documents the
+        client has not seen yet and the ``removed`` IDs that dropped out
+    """
+    order = [hit["_id"] for hit in hits]
+    known = set(previous_ids)
+    ranked = set(order)
+    return {
+        "order": order,
+        "added": {
+            hit["_id"]: hit["_source"] for hit in hits if hit["_id"] not in known
+        },
+        "removed": [doc_id for doc_id in previous_ids if doc_id not in ranked],
+    }
+
+
+class ProgressiveSearchService:
+    """Service for sending fast keyword hits before slower ranked results."""
+
+    def __init__(self, search_service: SearchService):
+        """
+        Initialize the progressive search service.
+
+        Args:
+            search_service: Service for performing searches
+        """
+        self.search_service = search_service
+
+    async def stream(
+        self, query: str = "", search_type: str = "keyword"
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Start a search and stream its results as a sequence of named events.
+
+        For hybrid searches the keyword leg is sent as soon as it returns while
+        the embedding and fused query run concurrently; the fused ranking then
+        follows as a ``rerank`` delta; if the keyword leg fails, the fused hits
+        are sent as the only ``results`` event. Other search types send a
+        single ``results`` event. Every stream ends with a ``done`` event carrying the
+        time to first result and the total latency in milliseconds.
+
+        The first results are computed before the stream is returned, so a
+        request shed by admission control before anything could be sent raises
+        ``OverloadedError`` here instead of failing inside the stream. If
+        ``admission_degrade_to_keyword`` is set, shed requests keep the keyword
+        ranking and the ``done`` event is flagged as ``degraded``.
+
+        Args:
+            query: Search query text
+            search_type: Type of search ('keyword', 'semantic', or 'hybrid')
+
+        Returns:
+            Async iterator over (event name, payload) tuples
+
+        Raises:
+            ValueError: If search_type is invalid or the query is empty for
+                semantic or hybrid search
+            OverloadedError: If the embedding was shed before any results
+                were available and degrading to keyword search is disabled
+        """
+        query = query.strip()
+        if search_type not in ("keyword", "semantic", "hybrid"):
+            raise ValueError(
+                f"Invalid search_type: {search_type}. "
+                "Must be 'keyword', 'semantic', or 'hybrid'"
+            )
+        if search_type != "keyword" and not query:
+            raise ValueError(f"Query cannot be empty for {search_type} search")
+
+        start = time.perf_counter()
+        if search_type == "hybrid":
+            return await self._start_hybrid(query, start)
+
+        degraded = False
+        try:
+            hits = await run_in_threadpool(
+                self.search_service.search_hits, query, search_type
+            )
+        except OverloadedError:
+            if not settings.admission_degrade_to_keyword:
+                raise
+            degraded = True
+            search_type = "keyword"
+            hits = await run_in_threadpool(
+                self.search_service.search_hits, query, search_type
+            )
+        return self._stream_single(search_type, hits, _elapsed_ms(start), degraded)
+
+    async def _start_hybrid(
+        self, query: str, start: float
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Run both hybrid legs until the keyword hits are ready to be sent."""
+        hybrid_task = asyncio.ensure_future(
+            run_in_threadpool(self.search_service.search_hits, query, "hybrid")
+        )
+        keyword_task = asyncio.ensure_future(
+            run_in_threadpool(self.search_service.search_hits, query, "keyword")
+        )
+        try:
+            await asyncio.wait(
+                {hybrid_task, keyword_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            shed = hybrid_task.done() and isinstance(
+                hybrid_task.exception(), OverloadedError
+            )
+            if shed and not settings.admission_degrade_to_keyword:
+                # Nothing was sent yet, so the request can still be rejected
+                keyword_task.cancel()
+                raise hybrid_task.exception()
+            try:
+                keyword_hits = await keyword_task
+            except Exception:
+                # The fused query may still succeed, send it as the only results
+                hybrid_hits = await hybrid_task
+                elapsed_ms = _elapsed_ms(start)
+                return self._stream_single("hybrid", hybrid_hits, elapsed_ms, False)
+        except BaseException:
+            hybrid_task.cancel()
+            raise
+
+        return self._stream_hybrid(start, keyword_hits, _elapsed_ms(start), hybrid_task)
+
+    async def _stream_single(
+        self,
+        search_type: str,
+        hits: List[Dict[str, Any]],
+        elapsed_ms: float,
+        degraded: bool,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Stream the results of a single search leg."""
+        yield "results", _results_payload(search_type, hits, elapsed_ms)
+        yield "done", _done_payload(elapsed_ms, elapsed_ms, degraded)
+
+    async def _stream_hybrid(
+        self,
+        start: float,
+        keyword_hits: List[Dict[str, Any]],
+        first_result_ms: float,
+        hybrid_task: "asyncio.Future[List[Dict[str, Any]]]",
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Stream keyword hits first, then the fused hybrid ranking as a delta."""
+        try:
+            yield "results", _results_payload("keyword", keyword_hits, first_result_ms)
+
+            degraded = False
+            try:
+                hybrid_hits = await hybrid_task
+            except OverloadedError:
+                if not settings.admission_degrade_to_keyword:
+                    # Keyword hits were already sent, report the shed in-band
+                    raise
+                # The keyword ranking already sent stands in for the fused one
+                degraded = True
+            total_ms = _elapsed_ms(start)
+
+            if not degraded:
+                keyword_ids = [hit["_id"] for hit in keyword_hits]
+                delta = compute_rank_delta(keyword_ids, hybrid_hits)
+                yield (
+                    "rerank",
+                    {
+                        "stage": "hybrid",
+                        "delta": delta,
+                        "elapsed_ms": total_ms,
+                    },
+                )
+        finally:
+            hybrid_task.cancel()
+
+        yield "done", _done_payload(first_result_ms, total_ms, degraded)
+
+
+def _results_payload(
+    stage: str, hits: List[Dict[str, Any]], elapsed_ms: float
+) -> Dict[str, Any]:
+    """Build the payload of a ``results`` event."""
+    return {
+        "stage": stage,
+        "ids": [hit["_id"] for hit in hits],
+        "results": [hit["_source"] for hit in hits],
+        "elapsed_ms": elapsed_ms,
+    }
+
+
+def _done_payload(
+    first_result_ms: float, total_ms: float, degraded: bool
+) -> Dict[str, Any]:
+    """Build the payload of a ``done`` event."""
+    return {
+        "time_to_first_result_ms": first_result_ms,
+        "total_ms": total_ms,
+        "degraded": degraded,
+    }
+
+
+def _elapsed_ms(start: float) -> float:
+    """Milliseconds elapsed since a ``time.perf_counter`` reading."""
+    return round((time.perf_counter() - start) * 1000, 2)
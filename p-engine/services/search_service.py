@@ -36,55 +36,87 @@ class SearchService:
         Returns:
             List of matching documents
 
+        Raises:
+            ValueError: If search_type is invalid
+        """
+        return [hit["_source"] for hit in self.search_hits(query, search_type)]
+
+    def search_hits(
+        self, query: str = "", search_type: str = "keyword"
+    ) -> List[Dict[str, Any]]:
+        """
+        Search audit logs and return the raw Elasticsearch hits.
+
+        Unlike ``search`` the hits keep their ``_id`` and ``_score``, which
+        callers need to compare rankings between search types.
+
+        Args:
+            query: Search query text
+            search_type: Type of search ('keyword', 'semantic', or 'hybrid')
+
+        Returns:
+            List of matching hits
+
         Raises:
             ValueError: If search_type is invalid
         """
         if search_type == "keyword":
-            return self._keyword_search(query)
+            es_query = self._keyword_query(query)
         elif search_type == "semantic":
-            return self._semantic_search(query)
+            es_query = self._semantic_query(query)
         elif search_type == "hybrid":
-            return self._hybrid_search(query)
+            es_query = self._hybrid_query(query)
         else:
             raise ValueError(
                 f"Invalid search_type: {search_type}. "
                 "Must be 'keyword', 'semantic', or 'hybrid'"
             )
 
-    def _keyword_search(self, query: str) -> List[Dict[str, Any]]:
+        return self._execute_search_hits(es_query)
+
+    @staticmethod
+    def build_keyword_query(query: str) -> Dict[str, Any]:
         """
-        Perform keyword-based search.
+        Build the Elasticsearch query clause used by keyword search.
 
         Args:
             query: Search query text
 
         Returns:
-            List of matching documents
+            Elasticsearch query clause dictionary
         """
         if not query:
-            # Return all logs if query is empty
-            es_query = {"query": {"match_all": {}}}
-        else:
-            es_query = {
-                "query": {
-                    "multi_match": {
-                        "query": query,
-                        "fields": ["summary", "description"],
-                    }
-                }
+            # Match all logs if query is empty
+            return {"match_all": {}}
+
+        return {
+            "multi_match": {
+                "query": query,
+                "fields": ["summary", "description"],
             }
+        }
 
-        return self._execute_search(es_query)
+    def _keyword_query(self, query: str) -> Dict[str, Any]:
+        """
+        Build a keyword-based search request.
 
-    def _semantic_search(self, query: str) -> List[Dict[str, Any]]:
+        Args:
+            query: Search query text
+
+        Returns:
+            Elasticsearch query dictionary
+        """
+        return {"query": self.build_keyword_query(query)}
+
+    def _semantic_query(self, query: str) -> Dict[str, Any]:
         """
-        Perform semantic (vector-based) search.
+        Build a semantic (vector-based) search request.
 
         Args:
             query: Search query text
 
         Returns:
-            List of matching documents
+            Elasticsearch query dictionary
 
         Raises:
             ValueError: If query is empty
@@ -94,7 +126,7 @@ class SearchService:
 
         query_vector = self.embedding_service.generate_embedding(query)
 
-        es_query = {
+        return {
             "knn": {
                 "field": "embedding_vector",
                 "query_vector": query_vector,
@@ -103,17 +135,15 @@ class SearchService:
             }
         }
 
-        return self._execute_search(es_query)
-
-    def _hybrid_search(self, query: str) -> List[Dict[str, Any]]:
+    def _hybrid_query(self, query: str) -> Dict[str, Any]:
         """
-        Perform hybrid search combining keyword and semantic search.
+        Build a hybrid search request combining keyword and semantic search.
 
         Args:
             query: Search query text
 
         Returns:
-            List of matching documents
+            Elasticsearch query dictionary
 
         Raises:
             ValueError: If query is empty
@@ -123,7 +153,7 @@ class SearchService:
 
         query_vector = self.embedding_service.generate_embedding(query)
 
-        es_query = {
+        return {
             "query": {
                 "multi_match": {"query": query, "fields": ["summary", "description"]}
             },
@@ -136,8 +166,6 @@ class SearchService:
             "rank": {"rrf": {}},
         }
 
-        return self._execute_search(es_query)
-
     def _execute_search(self, es_query: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Execute the Elasticsearch query.
@@ -148,10 +176,22 @@ class SearchService:
         Returns:
             List of document sources from search results
         """
-        response = self.es.search(index=self.index_name, body=es_query)
-        hits = [hit["_source"] for hit in response["hits"]["hits"]]
+        hits = [hit["_source"] for hit in self._execute_search_hits(es_query)]
         return hits
 
+    def _execute_search_hits(self, es_query: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Execute the Elasticsearch query and return the raw hits.
+
+        Args:
+            es_query: Elasticsearch query dictionary
+
+        Returns:
+            List of hits from search results
+        """
+        response = self.es.search(index=self.index_name, body=es_query)
+        return response["hits"]["hits"]
+
     def get_all_logs(self, size: int = 100) -> List[Dict[str, Any]]:
         """
         Get all audit logs.
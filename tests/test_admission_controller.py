@@ -0,0 +1,169 @@
+"""Tests for the embedding admission controller."""
+
+import importlib
+import threading
+import time
+import unittest
+
+admission = importlib.import_module("p-engine.services.admission_controller")
+AdmissionController = admission.AdmissionController
+OverloadedError = admission.OverloadedError
+Priority = admission.Priority
+
+
+def make_controller(max_concurrency=1, queue_limit=1, deadline=5.0, deadlines=None):
+    """Build a controller with the same limits for every priority."""
+    return AdmissionController(
+        max_concurrency=max_concurrency,
+        queue_limits={priority: queue_limit for priority in Priority},
+        deadlines=deadlines or {priority: deadline for priority in Priority},
+        retry_after=3,
+    )
+
+
+def wait_until(predicate, timeout=5.0):
+    """Poll until ``predicate`` is true, failing after ``timeout`` seconds."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("Condition not reached in time")
+        time.sleep(0.005)
+
+
+def queue_depth(controller, priority):
+    return controller.stats()["classes"][priority.name.lower()]["queue_depth"]
+
+
+def admitted(controller, priority):
+    return controller.stats()["classes"][priority.name.lower()]["admitted"]
+
+
+class Waiter(threading.Thread):
+    """Thread that holds a slot until released."""
+
+    def __init__(self, controller, priority):
+        super().__init__(daemon=True)
+        self.controller = controller
+        self.priority = priority
+        self.admitted = threading.Event()
+        self.release = threading.Event()
+        self.error = None
+
+    def run(self):
+        try:
+            with self.controller.slot(self.priority):
+                self.admitted.set()
+                self.release.wait(5)
+        except OverloadedError as e:
+            self.error = e
+
+
+class AdmissionControllerTest(unittest.TestCase):
+    def test_admits_immediately_when_idle(self):
+        controller = make_controller()
+
+        with controller.slot(Priority.INTERACTIVE):
+            self.assertEqual(controller.stats()["active"], 1)
+
+        self.assertEqual(controller.stats()["active"], 0)
+        self.assertEqual(admitted(controller, Priority.INTERACTIVE), 1)
+
+    def test_sheds_when_queue_is_full(self):
+        controller = make_controller(queue_limit=1)
+        holder = controller.slot(Priority.INTERACTIVE)
+        holder.__enter__()
+        waiter = Waiter(controller, Priority.INTERACTIVE)
+        waiter.start()
+        wait_until(lambda: queue_depth(controller, Priority.INTERACTIVE) == 1)
+
+        start = time.monotonic()
+        with self.assertRaises(OverloadedError) as ctx:
+            with controller.slot(Priority.INTERACTIVE):
+                pass
+        self.assertLess(time.monotonic() - start, 1.0)
+        self.assertEqual(ctx.exception.retry_after, 3)
+
+        holder.__exit__(None, None, None)
+        waiter.admitted.wait(5)
+        waiter.release.set()
+        waiter.join(5)
+        stats = controller.stats()["classes"]["interactive"]
+        self.assertEqual(stats["shed_queue_full"], 1)
+        self.assertEqual(stats["admitted"], 2)
+
+    def test_sheds_when_deadline_passes(self):
+        controller = make_controller(queue_limit=4)
+
+        with controller.slot(Priority.INTERACTIVE):
+            start = time.monotonic()
+            with self.assertRaises(OverloadedError):
+                with controller.slot(Priority.INTERACTIVE, deadline=0.05):
+                    pass
+            self.assertGreaterEqual(time.monotonic() - start, 0.05)
+
+        stats = controller.stats()["classes"]["interactive"]
+        self.assertEqual(stats["shed_deadline"], 1)
+        self.assertEqual(stats["queue_depth"], 0)
+
+    def test_batch_waits_while_interactive_is_queued(self):
+        controller = make_controller(max_concurrency=2, queue_limit=2)
+        first = controller.slot(Priority.INTERACTIVE)
+        second = controller.slot(Priority.INTERACTIVE)
+        first.__enter__()
+        second.__enter__()
+
+        # Queue batch first, then interactive: interactive must still win
+        batch = Waiter(controller, Priority.BATCH)
+        batch.start()
+        wait_until(lambda: queue_depth(controller, Priority.BATCH) == 1)
+        interactive = Waiter(controller, Priority.INTERACTIVE)
+        interactive.start()
+        wait_until(lambda: queue_depth(controller, Priority.INTERACTIVE) == 1)
+
+        first.__exit__(None, None, None)
+        self.assertTrue(interactive.admitted.wait(5))
+        self.assertFalse(batch.admitted.is_set())
+        self.assertEqual(queue_depth(controller, Priority.BATCH), 1)
+
+        second.__exit__(None, None, None)
+        self.assertTrue(batch.admitted.wait(5))
+
+        interactive.release.set()
+        batch.release.set()
+        interactive.join(5)
+        batch.join(5)
+        self.assertIsNone(interactive.error)
+        self.assertIsNone(batch.error)
+
+    def test_batch_starves_until_deadline_while_interactive_is_queued(self):
+        controller = make_controller(
+            queue_limit=2,
+            deadlines={Priority.INTERACTIVE: 5.0, Priority.BATCH: 0.3},
+        )
+        holder = controller.slot(Priority.INTERACTIVE)
+        holder.__enter__()
+        batch = Waiter(controller, Priority.BATCH)
+        batch.start()
+        wait_until(lambda: queue_depth(controller, Priority.BATCH) == 1)
+        interactive = Waiter(controller, Priority.INTERACTIVE)
+        interactive.start()
+        wait_until(lambda: queue_depth(controller, Priority.INTERACTIVE) == 1)
+
+        # The freed slot goes to the interactive caller, which keeps it past
+        # the batch deadline
+        holder.__exit__(None, None, None)
+        self.assertTrue(interactive.admitted.wait(5))
+        batch.join(5)
+
+        self.assertIsInstance(batch.error, OverloadedError)
+        self.assertFalse(batch.admitted.is_set())
+        stats = controller.stats()["classes"]["batch"]
+        self.assertEqual(stats["shed_deadline"], 1)
+        self.assertEqual(stats["admitted"], 0)
+
+        interactive.release.set()
+        interactive.join(5)
+
+
+if __name__ == "__main__":
+    unittest.main()
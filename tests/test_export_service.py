@@ -0,0 +1,154 @@
+"""Tests for streaming bulk exports."""
+
+import importlib
+import io
+import json
+import threading
+import unittest
+from unittest import mock
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+export_service = importlib.import_module("p-engine.services.export_service")
+ExportService = export_service.ExportService
+
+SLICES = 3
+BATCH_SIZE = 2
+DOCS_PER_SLICE = 5
+
+
+def make_doc(slice_id, position):
+    doc_id = f"{slice_id}-{position}"
+    return {
+        "id": doc_id,
+        "action": "user.login",
+        "target_entities": [{"id": doc_id, "type": "user"}],
+    }
+
+
+class FakeElasticsearch:
+    """Serves sliced ``search_after`` pages and records point-in-time calls."""
+
+    def __init__(self, failing_slice=None):
+        self.failing_slice = failing_slice
+        self.opened = []
+        self.closed = []
+        self._lock = threading.Lock()
+
+    def open_point_in_time(self, index, keep_alive):
+        pit_id = f"pit-{len(self.opened)}"
+        self.opened.append(pit_id)
+        return {"id": pit_id}
+
+    def close_point_in_time(self, id):
+        with self._lock:
+            self.closed.append(id)
+
+    def search(self, body):
+        slice_id = body.get("slice", {}).get("id", 0)
+        if slice_id == self.failing_slice:
+            raise RuntimeError(f"slice {slice_id} failed")
+        start = body.get("search_after", [-1])[0] + 1
+        end = min(start + body["size"], DOCS_PER_SLICE)
+        hits = [
+            {"_source": make_doc(slice_id, position), "sort": [position]}
+            for position in range(start, end)
+        ]
+        return {"pit_id": body["pit"]["id"], "hits": {"hits": hits}}
+
+
+def expected_ids():
+    return sorted(
+        f"{slice_id}-{position}"
+        for slice_id in range(SLICES)
+        for position in range(DOCS_PER_SLICE)
+    )
+
+
+class ExportServiceTest(unittest.TestCase):
+    def setUp(self):
+        for name, value in (
+            ("export_slices", SLICES),
+            ("export_batch_size", BATCH_SIZE),
+            ("export_max_buffered_batches", 1),
+        ):
+            patcher = mock.patch.object(export_service.settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def export(self, es, export_format="ndjson"):
+        return ExportService(es).export(query="", export_format=export_format)
+
+    def test_closes_pit_once_when_exhausted(self):
+        es = FakeElasticsearch()
+        stream = self.export(es)
+
+        list(stream)
+        stream.close()
+
+        self.assertEqual(es.closed, ["pit-0"])
+
+    def test_closes_pit_when_closed_before_first_chunk(self):
+        es = FakeElasticsearch()
+        stream = self.export(es)
+
+        stream.close()
+        stream.close()
+
+        self.assertEqual(es.closed, ["pit-0"])
+
+    def test_closes_pit_when_closed_mid_stream(self):
+        es = FakeElasticsearch()
+        stream = self.export(es)
+
+        next(stream)
+        stream.close()
+
+        self.assertEqual(es.closed, ["pit-0"])
+        with self.assertRaises(StopIteration):
+            next(stream)
+        self.assertEqual(es.closed, ["pit-0"])
+
+    def test_closes_pit_when_slice_search_fails(self):
+        es = FakeElasticsearch(failing_slice=1)
+        stream = self.export(es)
+
+        with self.assertRaisesRegex(RuntimeError, "slice 1 failed"):
+            list(stream)
+        stream.close()
+
+        self.assertEqual(es.closed, ["pit-0"])
+
+    def test_rejects_non_keyword_search_without_opening_pit(self):
+        es = FakeElasticsearch()
+
+        with self.assertRaises(ValueError):
+            ExportService(es).export(query="login", search_type="semantic")
+
+        self.assertEqual(es.opened, [])
+
+    def test_ndjson_holds_every_row(self):
+        data = b"".join(self.export(FakeElasticsearch(), "ndjson"))
+
+        docs = [json.loads(line) for line in data.decode("utf-8").splitlines()]
+        self.assertEqual(sorted(doc["id"] for doc in docs), expected_ids())
+
+    def test_arrow_holds_every_row(self):
+        data = b"".join(self.export(FakeElasticsearch(), "arrow"))
+
+        table = pa.ipc.open_stream(data).read_all()
+        self.assertEqual(sorted(table.column("id").to_pylist()), expected_ids())
+        self.assertEqual(table.schema, export_service._arrow_schema())
+
+    def test_parquet_holds_every_row(self):
+        data = b"".join(self.export(FakeElasticsearch(), "parquet"))
+
+        table = pq.read_table(io.BytesIO(data))
+        self.assertEqual(sorted(table.column("id").to_pylist()), expected_ids())
+        entities = table.column("target_entities").to_pylist()
+        self.assertEqual(entities[0], [{"id": table["id"][0].as_py(), "type": "user"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,197 @@
+"""Tests for versioned index builds and bulk file parsing."""
+
+import importlib
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+index_service = importlib.import_module("p-engine.services.index_service")
+IndexService = index_service.IndexService
+
+ALIAS = "audit_logs"
+
+
+class FakeIndices:
+    """Records index API calls against an in-memory set of indices."""
+
+    def __init__(self, indices=(), alias_indices=()):
+        self.indices = set(indices) | set(alias_indices)
+        self.alias_indices = list(alias_indices)
+        self.calls = []
+
+    def create(self, index, settings, mappings):
+        self.calls.append(("create", index))
+        self.indices.add(index)
+
+    def delete(self, index, ignore_unavailable=False):
+        self.calls.append(("delete", index))
+        for name in index.split(","):
+            self.indices.discard(name)
+
+    def exists(self, index):
+        return index in self.indices
+
+    def exists_alias(self, name):
+        return bool(self.alias_indices)
+
+    def get_alias(self, name):
+        return {index: {"aliases": {name: {}}} for index in self.alias_indices}
+
+    def refresh(self, index):
+        pass
+
+    def forcemerge(self, index, max_num_segments):
+        pass
+
+    def put_settings(self, index, settings):
+        pass
+
+    def segments(self, index):
+        copy = {"routing": {"primary": True}, "segments": {"_0": {}}}
+        return {"indices": {index: {"shards": {"0": [copy]}}}}
+
+    def update_aliases(self, actions):
+        self.calls.append(("update_aliases", actions))
+
+
+class FakeElasticsearch:
+    """Minimal client exposing the APIs used by IndexService."""
+
+    def __init__(self, indices):
+        self.indices = indices
+
+    def options(self, **kwargs):
+        return self
+
+
+def fake_streaming_bulk(rejected_ids=()):
+    """Build a streaming_bulk stand-in that rejects the given document IDs."""
+
+    def streaming_bulk(client, actions, chunk_size, raise_on_error):
+        for action in actions:
+            yield action["_id"] not in rejected_ids, {"index": {"_id": action["_id"]}}
+
+    return streaming_bulk
+
+
+class IndexServiceTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.NamedTemporaryFile("w", suffix=".ndjson", delete=False)
+        self.addCleanup(os.remove, tmp.name)
+        self.path = tmp.name
+        self.tmp = tmp
+
+    def write_bulk(self, content):
+        with self.tmp as f:
+            f.write(content)
+
+    def write_docs(self, *ids):
+        self.write_bulk(
+            "".join(f'{{"index": {{"_id": "{i}"}}}}\n{{"id": "{i}"}}\n' for i in ids)
+        )
+
+    def build(self, indices, rejected_ids=(), **kwargs):
+        service = IndexService(FakeElasticsearch(indices))
+        with mock.patch.object(
+            index_service, "streaming_bulk", fake_streaming_bulk(rejected_ids)
+        ):
+            return service.build(self.path, **kwargs)
+
+    def test_build_over_max_failures_deletes_new_index(self):
+        self.write_docs("1", "2", "3")
+        indices = FakeIndices(alias_indices=["audit_logs-v1-old"])
+
+        with self.assertRaisesRegex(ValueError, "rejected 2 documents"):
+            self.build(indices, rejected_ids={"1", "2"}, max_failures=1)
+
+        (create, new_index), delete = indices.calls
+        self.assertEqual(create, "create")
+        self.assertEqual(delete, ("delete", new_index))
+        self.assertEqual(indices.indices, {"audit_logs-v1-old"})
+
+    def test_build_within_max_failures_swaps_alias(self):
+        self.write_docs("1", "2")
+        indices = FakeIndices(alias_indices=["audit_logs-v1-old"])
+
+        report = self.build(indices, rejected_ids={"1"}, max_failures=1)
+
+        self.assertEqual(report.documents_indexed, 1)
+        self.assertEqual(report.documents_failed, 1)
+        self.assertEqual(report.previous_indices, ["audit_logs-v1-old"])
+
+    def test_build_with_no_documents_deletes_new_index(self):
+        self.write_bulk("")
+        indices = FakeIndices()
+
+        with self.assertRaisesRegex(ValueError, "indexed no documents"):
+            self.build(indices)
+
+        self.assertEqual([call[0] for call in indices.calls], ["create", "delete"])
+        self.assertEqual(indices.indices, set())
+
+    def test_swap_from_legacy_concrete_index(self):
+        self.write_docs("1")
+        indices = FakeIndices(indices=[ALIAS])
+
+        report = self.build(indices)
+
+        alias_updates = [call for call in indices.calls if call[0] == "update_aliases"]
+        self.assertEqual(
+            alias_updates,
+            [
+                (
+                    "update_aliases",
+                    [
+                        {"remove_index": {"index": ALIAS}},
+                        {"add": {"index": report.index, "alias": ALIAS}},
+                    ],
+                )
+            ],
+        )
+        self.assertEqual(report.previous_indices, [])
+
+    def test_delete_old_only_deletes_previous_indices(self):
+        self.write_docs("1")
+        previous = ["audit_logs-v1-a", "audit_logs-v1-b"]
+        indices = FakeIndices(indices=["unrelated"], alias_indices=previous)
+
+        report = self.build(indices, delete_old=True)
+
+        deletes = [call for call in indices.calls if call[0] == "delete"]
+        self.assertEqual(deletes, [("delete", ",".join(previous))])
+        self.assertEqual(indices.indices, {"unrelated", report.index})
+
+    def test_trailing_action_line_raises_with_line_number(self):
+        self.write_bulk('{"index": {"_id": "1"}}\n{"id": "1"}\n{"index": {}}\n')
+        indices = FakeIndices()
+
+        with self.assertRaisesRegex(
+            ValueError, r":4: missing document for the 'index' action on line 3"
+        ):
+            self.build(indices)
+
+        self.assertEqual([call[0] for call in indices.calls], ["create", "delete"])
+
+    def test_invalid_json_raises_with_line_number(self):
+        self.write_bulk('{"index": {}}\n{"id": "1"\n')
+
+        with self.assertRaisesRegex(ValueError, r":2: invalid JSON"):
+            self.build(FakeIndices())
+
+    def test_unsupported_action_raises_with_line_number(self):
+        self.write_bulk('{"index": {}}\n{"id": "1"}\n{"update": {"_id": "1"}}\n')
+
+        with self.assertRaisesRegex(ValueError, r":3: unsupported bulk action"):
+            self.build(FakeIndices())
+
+    def test_delete_actions_are_skipped(self):
+        self.write_bulk('{"delete": {"_id": "9"}}\n{"index": {}}\n{"id": "1"}\n')
+
+        report = self.build(FakeIndices())
+
+        self.assertEqual(report.documents_indexed, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,161 @@
+"""Tests for progressive search streaming."""
+
+import importlib
+import threading
+import unittest
+from unittest import mock
+
+progressive = importlib.import_module("p-engine.services.progressive_search_service")
+admission = importlib.import_module("p-engine.services.admission_controller")
+ProgressiveSearchService = progressive.ProgressiveSearchService
+compute_rank_delta = progressive.compute_rank_delta
+OverloadedError = admission.OverloadedError
+
+
+def hit(doc_id):
+    return {"_id": doc_id, "_source": {"id": doc_id}}
+
+
+KEYWORD_HITS = [hit("a"), hit("b"), hit("c")]
+HYBRID_HITS = [hit("c"), hit("d"), hit("a")]
+
+
+class FakeSearchService:
+    """Returns or raises a canned result per search type.
+
+    A leg can be held back until its ``release`` event is set, so tests can
+    control which leg of a hybrid search finishes first.
+    """
+
+    def __init__(self, **results):
+        self.results = results
+        self.release = {search_type: threading.Event() for search_type in results}
+        for event in self.release.values():
+            event.set()
+
+    def hold(self, search_type):
+        self.release[search_type].clear()
+
+    def search_hits(self, query, search_type):
+        self.release[search_type].wait(5)
+        result = self.results[search_type]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def shed():
+    return OverloadedError("Embedding model is overloaded", retry_after=2)
+
+
+class ComputeRankDeltaTest(unittest.TestCase):
+    def test_delta_against_previous_ids(self):
+        delta = compute_rank_delta(["a", "b", "c"], HYBRID_HITS)
+
+        self.assertEqual(delta["order"], ["c", "d", "a"])
+        self.assertEqual(delta["added"], {"d": {"id": "d"}})
+        self.assertEqual(delta["removed"], ["b"])
+
+    def test_same_ranking_has_no_changes(self):
+        delta = compute_rank_delta(["a", "b"], [hit("a"), hit("b")])
+
+        self.assertEqual(delta, {"order": ["a", "b"], "added": {}, "removed": []})
+
+
+class ProgressiveSearchServiceTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        patcher = mock.patch.object(
+            progressive.settings, "admission_degrade_to_keyword", False
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def collect(self, events):
+        return [item async for item in events]
+
+    async def test_hybrid_sends_keyword_hits_then_rerank(self):
+        service = FakeSearchService(keyword=KEYWORD_HITS, hybrid=HYBRID_HITS)
+
+        events = await self.collect(
+            await ProgressiveSearchService(service).stream("login", "hybrid")
+        )
+
+        self.assertEqual([name for name, _ in events], ["results", "rerank", "done"])
+        self.assertEqual(events[0][1]["ids"], ["a", "b", "c"])
+        self.assertEqual(events[1][1]["delta"]["order"], ["c", "d", "a"])
+        self.assertFalse(events[2][1]["degraded"])
+
+    async def test_keyword_leg_failure_sends_hybrid_hits(self):
+        service = FakeSearchService(
+            keyword=RuntimeError("keyword leg failed"), hybrid=HYBRID_HITS
+        )
+
+        events = await self.collect(
+            await ProgressiveSearchService(service).stream("login", "hybrid")
+        )
+
+        self.assertEqual([name for name, _ in events], ["results", "done"])
+        self.assertEqual(events[0][1]["stage"], "hybrid")
+        self.assertEqual(events[0][1]["ids"], ["c", "d", "a"])
+
+    async def test_both_legs_failing_raises(self):
+        service = FakeSearchService(
+            keyword=RuntimeError("keyword leg failed"),
+            hybrid=RuntimeError("hybrid leg failed"),
+        )
+
+        with self.assertRaisesRegex(RuntimeError, "hybrid leg failed"):
+            await ProgressiveSearchService(service).stream("login", "hybrid")
+
+    async def test_shed_before_first_results_raises(self):
+        service = FakeSearchService(keyword=KEYWORD_HITS, hybrid=shed())
+        service.hold("keyword")
+        self.addCleanup(service.release["keyword"].set)
+
+        with self.assertRaises(OverloadedError) as ctx:
+            await ProgressiveSearchService(service).stream("login", "hybrid")
+        self.assertEqual(ctx.exception.retry_after, 2)
+
+    async def test_semantic_shed_raises(self):
+        service = FakeSearchService(semantic=shed())
+
+        with self.assertRaises(OverloadedError):
+            await ProgressiveSearchService(service).stream("login", "semantic")
+
+    async def test_shed_after_first_results_is_raised_in_stream(self):
+        service = FakeSearchService(keyword=KEYWORD_HITS, hybrid=shed())
+        service.hold("hybrid")
+        self.addCleanup(service.release["hybrid"].set)
+
+        events = await ProgressiveSearchService(service).stream("login", "hybrid")
+        name, payload = await anext(events)
+        self.assertEqual(name, "results")
+        self.assertEqual(payload["ids"], ["a", "b", "c"])
+
+        service.release["hybrid"].set()
+        with self.assertRaises(OverloadedError):
+            await anext(events)
+
+    async def test_shed_with_degrade_keeps_keyword_results(self):
+        service = FakeSearchService(keyword=KEYWORD_HITS, semantic=shed())
+
+        with mock.patch.object(
+            progressive.settings, "admission_degrade_to_keyword", True
+        ):
+            events = await self.collect(
+                await ProgressiveSearchService(service).stream("login", "semantic")
+            )
+
+        self.assertEqual([name for name, _ in events], ["results", "done"])
+        self.assertEqual(events[0][1]["stage"], "keyword")
+        self.assertTrue(events[1][1]["degraded"])
+
+    async def test_empty_query_is_rejected(self):
+        service = FakeSearchService()
+
+        with self.assertRaises(ValueError):
+            await ProgressiveSearchService(service).stream("  ", "hybrid")
+
+
+if __name__ == "__main__":
+    unittest.main()